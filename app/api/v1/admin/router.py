@@ -1,3 +1,4 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from .schemas import AdminCreate, AdminUpdate, BookCaseCreate
 from app.dependencies import get_admin_service, get_current_admin, get_user_service
@@ -5,6 +6,8 @@ from app.core.security import oauth2_scheme
 from app.domain.models.enums import TypeOrdering
 from app.domain.services import UserService
 
+logger = logging.getLogger(__name__)
+
 admin_router = APIRouter(
     prefix="/api/v1/admin",
     tags=["admin"],
@@ -19,21 +22,18 @@ def create(admin: AdminCreate, admin_service: UserService = Depends(get_admin_se
     - Si YA hay admins: requiere token de admin para crear más
     """
     try:
-        print(f"Creating new admin with data: {admin}")
         data = admin_service.add(admin.model_dump())
         if data is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Error al crear administrador: el servicio devolvió None"
             )
-        print(f"Admin created successfully: {data.get_id()}")
+        logger.debug("Admin created successfully: %s", data.get_id())
         return {"message": "administrador creado satisfactoriamente", "data": data.to_dict()}
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in create endpoint: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("Error in create endpoint: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error al crear administrador: {str(e)}"
@@ -42,7 +42,7 @@ class AuthAPIService:
     def __create_token_response(self, user: User, type_token: str = 'bearer') -> dict:
         """Construye y devuelve el dict con `access_token` y `token_type` para un usuario dado."""
         email = user.get_email() 
-        role = user.get_role().name
+        role = user.get_role_name()
         access_token = create_access_token(data={"sub": email, "role": role}, expires_delta=timedelta(minutes=self._expire_minutes))
         return (access_token, type_token)
     
@@ -60,7 +60,7 @@ class AuthAPIService:
             
             token = create_access_token({
                 "sub": user.get_email(),
-                "role": user.get_role().name
+                "role": user.get_role_name()
             }, timedelta(minutes=self._expire_minutes))
             
             return {"access_token": token, "token_type": "bearer"}
@@ -1,8 +1,12 @@
+import logging
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import StaticPool
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
 # Configuración especial para SQLite
 engine = create_engine(
     settings.DATABASE_URL,
@@ -25,4 +29,4 @@ def init_db():
     """Inicializa todas las tablas en la BD"""
     from app.persistence.models import UserORM, BookORM, LoanORM
     Base.metadata.create_all(bind=engine)
-    print("tablas creadas")
\ No newline at end of file
+    logger.info("tablas creadas")
\ No newline at end of file
@@ -1,9 +1,13 @@
+from bisect import bisect_left
 from typing import TypeVar, List, Callable, Any
 
 T = TypeVar('T')
 
 def binary_search(arr: List[T], key: Callable[[T], Any], item: T) -> int:
-    """Realiza una búsqueda binaria recursiva en `arr` usando `key`.
+    """Realiza una búsqueda binaria en `arr` usando `key`.
+
+    La clave del elemento buscado se calcula una sola vez y la bisección se
+    delega a `bisect.bisect_left` (implementado en C), sin recursión.
 
     Parámetros:
     - arr (List[T]): Lista ordenada de elementos donde se realizará la búsqueda.
@@ -14,8 +18,9 @@ def binary_search(arr: List[T], key: Callable[[T], Any], item: T) -> int:
       llamada a `key(item)` puede provocar una excepción en tiempo de ejecución.
 
     Retorna:
-    - int: Índice del elemento encontrado dentro de `arr`. Si el elemento
-      no se encuentra, se devuelve `-1`.
+    - int: Índice del elemento encontrado dentro de `arr` (la primera
+      ocurrencia si la clave se repite). Si el elemento no se encuentra,
+      se devuelve `-1`.
 
     Excepciones:
     - IndexError: Si `arr` es una lista vacía, se lanza `IndexError`.
@@ -24,31 +29,8 @@ def binary_search(arr: List[T], key: Callable[[T], Any], item: T) -> int:
     if arr is None or len(arr) == 0:
         raise IndexError("La lista proporcionada está vacía.")
 
-    def search(arr: List[T], head: int, tail: int) -> int:
-        """Función auxiliar recursiva que busca dentro del rango [`head`, `tail`].
-
-        Parámetros:
-        - arr (List[T]): Lista a buscar.
-        - head (int): Índice inicial del subarray.
-        - tail (int): Índice final del subarray.
-
-        Retorna:
-        - int: Índice del elemento encontrado o `-1` si no se encuentra.
-        """
-
-        if tail < head:
-            return -1
-
-        if key(arr[head]) == key(item):
-            return head
-        if key(arr[tail]) == key(item):
-            return tail
-
-        pivot = (head + tail) // 2
-
-        if key(arr[pivot]) > key(item):
-            return search(arr, head, pivot - 1)
-        else:
-            return search(arr, pivot + 1, tail)
-
-    return search(arr, 0, len(arr) - 1)
\ No newline at end of file
+    target = key(item)
+    index = bisect_left(arr, target, key=key)
+    if index < len(arr) and key(arr[index]) == target:
+        return index
+    return -1
@@ -29,6 +29,12 @@ class Book:
         data = book.to_dict()
     """
 
+    # Sin `__dict__`: atributos en slots fijos, más compactos y de acceso más rápido
+    __slots__ = (
+        "__id_IBSN", "__title", "__author", "__gender", "__weight", "__price",
+        "__description", "__frond_page_url", "__is_borrowed",
+    )
+
     __id_IBSN: str
     __title: str
     __author: str
@@ -3,6 +3,9 @@ from .bookshelf import BookShelf
 from .enums import TypeOrdering
 from typing import List
 
+# Mapa nombre -> miembro resuelto una vez para `from_dict` (importaciones masivas)
+_TO_MEMBERS = TypeOrdering.__members__
+
 class  BookCase:
     _stands: List[BookShelf]  # Lista de estantes
     _TypeOrdering: TypeOrdering
@@ -23,7 +26,7 @@ class  BookCase:
         store = [Book.from_dict(book_data) for book_data in data.get("store", [])]
         return cls(
             stands=stands,
-            TypeOrdering=TypeOrdering[data["TypeOrdering"]],
+            TypeOrdering=_TO_MEMBERS[data["TypeOrdering"]],
             weighCapacity=data["weighCapacity"],
             capacityStands=data["capacityStands"],
             store=store
@@ -73,7 +76,7 @@ class  BookCase:
         }
     
     def __str__(self):
-        total_books = sum(len(shelf.get_books()) for shelf in self._stands)
+        total_books = sum(shelf.get_book_count() for shelf in self._stands)
         return f"BookCase: {len(self._stands)} shelves, {total_books} books, {self._TypeOrdering}, capacity: {self._weighCapacity}kg"
     
     def __repr__(self):
@@ -1,10 +1,12 @@
 from .book import Book
-from typing import List
+from typing import Dict, List
 
 class BookShelf:
+    # Sin `__dict__` ni `__weakref__`: los estantes se guardan en listas densas dentro de BookCase
+    __slots__ = ("_id", "_books", "_current_weight")
 
     _id: str
-    _books: List[Book]
+    _books: Dict[str, Book]  # ISBN -> Book, conserva el orden de inserción
     _current_weight: float
 
     def __init__(self, books: List[Book], shelf_id: str = None):
@@ -23,8 +25,11 @@ class BookShelf:
     def get_id(self):
           return self._id
     
-    def get_books(self):
-          return self._books
+    def get_books(self) -> List[Book]:
+          return list(self._books.values())
+    
+    def get_book_count(self) -> int:
+          return len(self._books)
     
     def get_current_weight(self):
           return self._current_weight
@@ -33,28 +38,31 @@ class BookShelf:
           self._id = id
     
     def set_books(self, books: List[Book]):
-          self._books = books
+          self._books = {book.get_id_IBSN(): book for book in books}
           self._update_weight()
     
     def add_book(self, book: Book):
-          """Agrega un libro al estante."""
-          self._books.append(book)
-          self._update_weight()
+          """Agrega un libro al estante (reemplaza al que tenga el mismo ISBN)."""
+          previous = self._books.pop(book.get_id_IBSN(), None)
+          if previous is not None:
+                self._current_weight -= previous.get_weight()
+          self._books[book.get_id_IBSN()] = book
+          self._current_weight += book.get_weight()
     
     def remove_book(self, book: Book):
           """Remueve un libro del estante."""
-          if book in self._books:
-              self._books.remove(book)
-              self._update_weight()
+          removed = self._books.pop(book.get_id_IBSN(), None)
+          if removed is not None:
+                self._current_weight -= removed.get_weight()
     
     def _update_weight(self):
-          """Actualiza el peso total del estante."""
-          self._current_weight = sum(book.get_weight() for book in self._books)
+          """Recalcula el peso total del estante."""
+          self._current_weight = sum(book.get_weight() for book in self._books.values())
     
     def to_dict(self):
           return {
                 "id": self._id,
-                "books": [book.to_dict() for book in self._books],
+                "books": [book.to_dict() for book in self._books.values()],
                 "current_weight": self._current_weight
           }
     
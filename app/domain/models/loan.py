@@ -5,13 +5,23 @@ from app.utils import generate_id
 from app.domain.exceptions import BookAlreadyBorrowedException, ValidationException, ResourceNotFoundException
 
 
+# Plantilla de `__str__` resuelta una sola vez (evita reconstruir el f-string en cada log)
+_LOAN_STR_TMPL = "Loan: {id} - User: {user} - Book: {book} - Date: {date}".format
+
 
 class Loan:
-    __id: str
-    __user: User
-    __book: Book
-    __loan_date: datetime
-    __status: bool
+    __slots__ = (
+        "_id", "_user", "_book", "_loan_date", "_loan_date_iso", "_loan_date_short", "_status",
+        "_user_service", "_book_service",
+    )
+
+    _id: str
+    _user: User
+    _book: Book
+    _loan_date: datetime
+    _loan_date_iso: str
+    _loan_date_short: str
+    _status: bool
     
     def __init__(self, id_user: str, id_book: str, loan_date: datetime, id: str = None, 
                  status: bool = True, searching: bool = False, skip_validation: bool = False,
@@ -71,34 +81,34 @@ class Loan:
         )
     
     def get_id(self):
-        return self.__id
+        return self._id
     def get_user(self):
         # ✅ Solo resolver si se pasó el servicio
-        if self._user_service and isinstance(self.__user, str):
-            self.__user = self._user_service.get_by_id(self.__user)
-        return self.__user
+        if self._user_service and isinstance(self._user, str):
+            self._user = self._user_service.get_by_id(self._user)
+        return self._user
     def get_book(self):
         # ✅ Solo resolver si se pasó el servicio
-        if self._book_service and isinstance(self.__book, str):
-            self.__book = self._book_service.get_by_isbn(self.__book)
-        return self.__book
+        if self._book_service and isinstance(self._book, str):
+            self._book = self._book_service.get_by_isbn(self._book)
+        return self._book
     def get_loan_date(self):
-        return self.__loan_date
+        return self._loan_date
     def get_status(self):
-        return self.__status
+        return self._status
     def set_status(self, status: bool):
         self.__set_status(status)
     
     def __set_id(self, id: str):
         """Asigna un `id`; si es `None`, lo genera automáticamente."""
         if id is None:
-            self.__id = generate_id()
+            self._id = generate_id()
         else:
-            self.__id = id
+            self._id = id
             
     def __set_user(self, id_user: str, searching: bool = False):
         if searching:
-            self.__user = id_user
+            self._user = id_user
             return
         if not id_user:
             raise ValidationException(f"ID no debe estar vacío, valor recibido: {id_user}")
@@ -108,18 +118,18 @@ class Loan:
             user = self._user_service.get_by_id(id_user)
             if user is None:
                 raise ResourceNotFoundException(f"Usuario con ID {id_user} no encontrado")
-            self.__user = user
+            self._user = user
         else:
             # ✅ Sin servicio, solo guardar el ID (lazy loading)
-            self.__user = id_user
+            self._user = id_user
                 
             if user is None:
                 raise ResourceNotFoundException(f"Usuario con ID {id_user} no encontrado")
-            self.__user = user
+            self._user = user
     
     def __set_book(self, id_book: str, inizialize: bool = False, searching: bool = False):
         if searching:
-            self.__book = id_book
+            self._book = id_book
             return
         if not id_book:
             raise ValidationException(f"ID ISBN no debe estar vacío")
@@ -133,30 +143,39 @@ class Loan:
             if book.get_is_borrowed():
                 raise BookAlreadyBorrowedException(f"Libro ya está prestado")
             
-            self.__book = book
+            self._book = book
         else:
             # ✅ Sin servicio, solo guardar el ISBN (lazy loading)
-            self.__book = id_book
+            self._book = id_book
         
     def __set_loan_date(self, loan_date: datetime):
-        self.__loan_date = loan_date
+        self._loan_date = loan_date
+        # `LoanORM.loan_date` admite NULL: sin fecha no hay nada que formatear
+        if loan_date is None:
+            self._loan_date_iso = None
+            self._loan_date_short = None
+            return
+        # Formatos precalculados para `to_dict`/`__repr__` y `__str__` (evita isoformat/strftime por llamada)
+        self._loan_date_iso = loan_date.isoformat()
+        self._loan_date_short = loan_date.strftime('%Y-%m-%d')
         
     def __set_status(self, status: bool):
-        if not isinstance(status, bool):
+        # bool solo tiene dos instancias: dos comparaciones de identidad bastan
+        if status is not True and status is not False:
                 raise ValidationException(f"El estado del préstamo debe ser booleano (True/False), recibido: {type(status).__name__}")
-        self.__status = status
+        self._status = status
         
     def get_user_id(self):
         """Retorna solo el ID del usuario."""
-        if isinstance(self.__user, str):
-            return self.__user  # ✅ Ya es un string (ID)
-        return self.__user.get_id()  # ✅ Es un objeto User
+        if isinstance(self._user, str):
+            return self._user  # ✅ Ya es un string (ID)
+        return self._user.get_id()  # ✅ Es un objeto User
 
     def get_book_isbn(self):
         """Retorna solo el ISBN del libro."""
-        if isinstance(self.__book, str):
-            return self.__book  # ✅ Ya es un string (ISBN)
-        return self.__book.get_id_IBSN()  # ✅ Es un objeto Book
+        if isinstance(self._book, str):
+            return self._book  # ✅ Ya es un string (ISBN)
+        return self._book.get_id_IBSN()  # ✅ Es un objeto Book
             
     def update_from_dict(self, json: dict):
         """Actualiza los atributos del préstamo a partir de un diccionario.
@@ -174,41 +193,44 @@ class Loan:
     def to_dict(self):
         """Convierte el préstamo a diccionario para la API."""
         return {
-            "id": self.__id,
+            "id": self._id,
             "user": self.get_user_id(),  # ✅ Siempre retorna string
             "book": self.get_book_isbn(),  # ✅ Siempre retorna string
-            "loan_date": self.__loan_date.isoformat(),
-            "status": self.__status
+            "loan_date": self._loan_date_iso,
+            "status": self._status
         }
         
     def to_dict_with_objects(self):
         return {
-            "id": self.__id,
-            "user": self.__user.to_dict(),
-            "book": self.__book.to_dict(),
-            "loan_date": self.__loan_date.isoformat(),
-            "status": self.__status
+            "id": self._id,
+            "user": self._user.to_dict(),
+            "book": self._book.to_dict(),
+            "loan_date": self._loan_date_iso,
+            "status": self._status
         }
         
     def __str__(self):
         """Sobreescribe la representación en string"""
-        return f"Loan: {self.__id} - User: {self.__user.get_fullName()} - Book: {self.__book.get_title()} - Date: {self.__loan_date.strftime('%Y-%m-%d')}"
+        return _LOAN_STR_TMPL(
+            id=self._id,
+            user=self._user.get_fullName(),
+            book=self._book.get_title(),
+            date=self._loan_date_short,
+        )
     def __repr__(self):
         """Sobreescribe la representación para debugging"""
-        return f"Loan(id={self.__id}, user={self.__user.get_id()}, book={self.__book.get_id_IBSN()}, loan_date={self.__loan_date.isoformat()}, status={self.__status})"
+        return f"Loan(id={self._id}, user={self._user.get_id()}, book={self._book.get_id_IBSN()}, loan_date={self._loan_date_iso}, status={self._status})"
     
     def __eq__(self, other):
-        """Comparación de igualdad entre instancias de Person.
+        """Comparación de igualdad entre instancias de Loan.
 
         Regla:
-        - Si ambos objetos tienen `id`, se comparan los `id`.
-        - Devuelve False si `other` no es una Prestamo.
+        - Dos préstamos son iguales si tienen el mismo `id`.
+        - Devuelve False si `other` no es un Loan.
         """
-        if self is other:
-            return True
-        if not isinstance(other, Loan):
-            return False
-        # Si ambos tienen id, usarlo como identidad
-        if getattr(self, "__id", None) and getattr(other, "__id", None):
-            return self.__id == other.__id
+        return type(other) is Loan and self._id == other._id
+
+    def __hash__(self):
+        """Hash basado en el `id`, coherente con `__eq__` (permite usar Loan en set/dict)."""
+        return hash(self._id)
 
@@ -1,8 +1,10 @@
-from . import Person
+from .person import Person
 from ..enums import PersonRole
 
 class Admin(Person):
     """Modelo de dominio para administradores (sin loans ni historial)."""
+
+    __slots__ = ()
     
     def __init__(
         self,
@@ -10,7 +12,8 @@ class Admin(Person):
         email: str,
         password: str,
         id: str = None,
-        password_is_hashed: bool = False
+        password_is_hashed: bool = False,
+        trusted: bool = False
     ):
         super().__init__(
             fullName=fullName,
@@ -18,7 +21,8 @@ class Admin(Person):
             password=password,
             id=id,
             role=PersonRole.ADMIN,
-            password_is_hashed=password_is_hashed
+            password_is_hashed=password_is_hashed,
+            trusted=trusted
         )
     
     def to_dict(self) -> dict:
@@ -28,5 +32,5 @@ class Admin(Person):
             "fullName": self.get_fullName(),
             "email": self.get_email(),
             "password": self.get_password(),
-            "role": self.get_role().name
+            "role": self.get_role_name()
         }
\ No newline at end of file
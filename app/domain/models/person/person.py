@@ -4,13 +4,64 @@ Contiene la clase `Person` que representa a una persona/usuario del sistema
 con validaciones básicas y manejo seguro de contraseñas.
 """
 
-import re
+import os
+import string
+import sys
+from functools import cache
 
 from ..enums import PersonRole
 from app.domain.exceptions import ValidationException
 from werkzeug.security import generate_password_hash, check_password_hash
 from app.utils import generate_id
 
+# Caracteres permitidos en cada parte del email
+_EMAIL_LOCAL_OK = frozenset(string.ascii_letters + string.digits + "_.+-")
+_EMAIL_DOMAIN_OK = frozenset(string.ascii_letters + string.digits + "-.")
+
+# Roles por nombre y mensaje de roles válidos, calculados una sola vez
+_ROLE_BY_NAME = {role.name: role for role in PersonRole}
+_VALID_ROLES_STR = ", ".join(_ROLE_BY_NAME)
+
+
+def _resolve_role(role) -> PersonRole:
+    """Convierte `role` (un `PersonRole` o su nombre) al miembro del enum.
+
+    Raises:
+        ValidationException: Si `role` no corresponde a ningún `PersonRole`.
+    """
+    if isinstance(role, PersonRole):
+        return role
+    role_enum = _ROLE_BY_NAME.get(role) if isinstance(role, str) else None
+    if role_enum is None:
+        raise ValidationException(
+            f"Rol '{role}' no válido. Roles válidos: {_VALID_ROLES_STR}"
+        )
+    return role_enum
+
+
+def _is_valid_email(email: str) -> bool:
+    """Valida el formato `usuario@dominio.ext` sin pasar por el motor de regex.
+
+    Equivale a `^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9-.]+$`: parte local
+    no vacía, un único `@`, etiqueta de dominio no vacía sin puntos, un punto
+    y al menos un carácter más.
+    """
+    at = email.find("@")
+    if at <= 0:
+        return False
+    dot = email.find(".", at + 1)
+    if dot <= at + 1 or dot == len(email) - 1:
+        return False
+    return _EMAIL_LOCAL_OK.issuperset(email[:at]) and _EMAIL_DOMAIN_OK.issuperset(email[at + 1:])
+
+
+@cache
+def _demo_password_hash() -> str:
+    """Hash de la contraseña demo (`default`/`from_search_api`), calculado una sola vez por proceso."""
+    return generate_password_hash(
+        "adventuretime", method=Person._HASH_METHOD, salt_length=Person._HASH_SALT_LEN
+    )
+
 
 class Person:
     """Representa a una persona en la librería.
@@ -27,46 +78,61 @@ class Person:
     la contraseña de forma segura.
     """
 
+    __slots__ = ("_id", "_fullName", "_email", "_password", "_role", "_role_name", "_historial")
+
     _id: str
     _fullName: str
     _email: str
     _password: str
     _role: PersonRole
+    _role_name: str  # `_role.name` precalculado para serialización
     _historial: list
-    
 
-    def __init__(self, fullName: str, email: str, password: str, role: PersonRole, id: str = None, password_is_hashed: bool = False):
+    # Coste del hash de contraseñas. Por defecto el de Werkzeug (scrypt); seeds y
+    # tests pueden bajarlo con p. ej. SGA_HASH_METHOD="pbkdf2:sha256:1".
+    # En producción debe mantenerse el valor por defecto.
+    _HASH_METHOD = os.getenv("SGA_HASH_METHOD", "scrypt")
+    _HASH_SALT_LEN = int(os.getenv("SGA_HASH_SALT_LEN", "16"))
+
+    def __init__(self, fullName: str, email: str, password: str, role: PersonRole, id: str = None, password_is_hashed: bool = False, trusted: bool = False):
         """Inicializa una nueva instancia de Person.
 
         Args:
             fullName (str): Nombre completo de la persona.
             email (str): Correo electrónico de la persona.
             password (str): Contraseña en texto plano o hasheada.
-            role (PersonRole): Rol de la persona.
+            role (PersonRole | str): Rol de la persona (miembro o nombre del enum).
             id (str, optional): Identificador único. Defaults to None.
             password_is_hashed (bool, optional): Si la contraseña ya está hasheada. Defaults to False.
+            trusted (bool, optional): Si los datos vienen de la persistencia (ya validados y
+                normalizados); el nombre se asigna sin volver a validarlo. Defaults to False.
 
         Raises:
             ValidationException: Si fullName, email o password no cumplen las validaciones.
-            ValidationException: Si role no es una instancia de PersonRole.
+            ValidationException: Si role no es un PersonRole ni el nombre de uno.
         """
         self.__set_id(id)
-        self.set_fullName(fullName)
+        if trusted:
+            self._set_fullName_unchecked(fullName)
+        else:
+            self.set_fullName(fullName)
         self.set_email(email)
         if password_is_hashed:
             self._password = password
         else:
             self.set_password(password)
-        self.__set_role(role)
+        self.__set_role(_resolve_role(role))
+        self._historial = []
 
     @classmethod
-    def from_dict(cls, data: dict, role: PersonRole = PersonRole.USER ,password_is_hashed: bool = True):
+    def from_dict(cls, data: dict, role: PersonRole = PersonRole.USER ,password_is_hashed: bool = True, trusted: bool = False):
         """Crea una instancia de Person a partir de un diccionario.
 
         Args:
             data (dict): Diccionario con las claves 'fullName', 'email', 'password' y 'id' (opcional).
             role (PersonRole): Rol de la persona. Defaults to PersonRole.USER.
             password_is_hashed (bool): Si la contraseña ya está hasheada. Defaults to True.
+            trusted (bool): Si `data` viene de la persistencia (nombre ya normalizado). Defaults to False.
 
         Returns:
             Person: Nueva instancia de Person.
@@ -75,27 +141,68 @@ class Person:
             ValidationException: Si data no es un diccionario o falta alguna clave requerida.
             ValidationException: Si los valores no cumplen las validaciones.
         """
-        # print(data)
         if not isinstance(data, dict):
             raise ValidationException("Los datos deben ser un diccionario válido")
         
-        # Validar campos requeridos
-        required_fields = ["fullName", "email", "password"]
-        missing_fields = [field for field in required_fields if not data.get(field)]
+        # Validar campos requeridos (la lista de faltantes solo se construye si hay error)
+        fullName = data.get("fullName")
+        email = data.get("email")
+        password = data.get("password")
         
-        if missing_fields:
+        if not fullName or not email or not password:
+            missing_fields = [
+                field for field, value in (("fullName", fullName), ("email", email), ("password", password))
+                if not value
+            ]
             raise ValidationException(
                 f"Faltan campos requeridos: {', '.join(missing_fields)}"
             )
         
         return cls(
-            fullName=data.get("fullName"),
-            email=data.get("email"),
-            password=data.get("password"),
+            fullName=fullName,
+            email=email,
+            password=password,
             role=role,
             id=data.get("id"),
             password_is_hashed=password_is_hashed,
+            trusted=trusted,
         )
+
+    @classmethod
+    def from_dicts_bulk(cls, records, role: PersonRole = PersonRole.USER) -> list:
+        """Crea muchas instancias a partir de registros ya persistidos (carga masiva).
+
+        Los registros se consideran confiables (validados al escribirse y con la
+        contraseña ya hasheada), por lo que no se pasa por `__init__` ni por los
+        setters: cada instancia se arma con asignaciones directas.
+
+        Args:
+            records (Iterable[dict]): Diccionarios con 'fullName', 'email', 'password',
+                'id' (opcional) y 'role' (opcional, nombre o `PersonRole`).
+            role (PersonRole): Rol por defecto si el registro no trae uno. Defaults to PersonRole.USER.
+
+        Returns:
+            list: Instancias creadas, en el mismo orden que `records`.
+
+        Raises:
+            ValidationException: Si algún registro trae un 'role' no válido.
+        """
+        new = cls.__new__
+        people = []
+        append = people.append
+        for data in records:
+            person = new(cls)
+            person._id = data.get("id") or generate_id()
+            person._fullName = data["fullName"]
+            person._email = sys.intern(data["email"])  # igual que set_email
+            person._password = data["password"]
+            person_role = data.get("role")
+            person_role = role if person_role is None else _resolve_role(person_role)
+            person._role = person_role
+            person._role_name = person_role.name
+            person._historial = []
+            append(person)
+        return people
         
     @classmethod
     def from_search_api(cls, id: str):
@@ -107,12 +214,8 @@ class Person:
         Returns:
             Person: Nueva instancia con valores por defecto.
         """
-        return cls(
-            fullName="Gum Guardians",
-            email="gumGuardians.adventure@time.cartoon",
-            password="adventuretime",
-            role=PersonRole.USER,
-            id=id,
+        return cls._from_trusted(
+            id, "Gum Guardians", "gumGuardians.adventure@time.cartoon", _demo_password_hash()
         )
 
     @classmethod
@@ -122,14 +225,36 @@ class Person:
         Returns:
             Person: Nueva instancia con valores por defecto.
         """
-        return cls(
-            fullName="Jake the Dog",
-            email="jakeTheDog.adventure@time.cartoon",
-            password="adventuretime",
-            role=PersonRole.USER,
-            id="00000000000000000",
+        return cls._from_trusted(
+            "00000000000000000", "Jake the Dog", "jakeTheDog.adventure@time.cartoon", _demo_password_hash()
         )
 
+    @classmethod
+    def _from_trusted(cls, id: str, fullName: str, email: str, password_hash: str, role: PersonRole = PersonRole.USER):
+        """Arma una instancia con valores ya válidos sin pasar por `__init__` ni los setters.
+
+        Uso interno para constantes conocidas (`default`, `from_search_api`).
+
+        Args:
+            id (str): Identificador; si es None se genera.
+            fullName (str): Nombre completo ya normalizado.
+            email (str): Email con formato válido.
+            password_hash (str): Contraseña ya hasheada.
+            role (PersonRole): Rol de la persona. Defaults to PersonRole.USER.
+
+        Returns:
+            Person: Nueva instancia de la clase.
+        """
+        person = cls.__new__(cls)
+        person.__set_id(id)
+        person._fullName = fullName
+        person._email = email
+        person._password = password_hash
+        person._role = role
+        person._role_name = role.name
+        person._historial = []
+        return person
+
     def get_id(self):
         """Retorna el identificador único de la persona.
 
@@ -170,6 +295,14 @@ class Person:
         """
         return self._role
 
+    def get_role_name(self):
+        """Retorna el nombre del rol (precalculado al asignar el rol).
+
+        Returns:
+            str: El nombre del rol, p. ej. "USER".
+        """
+        return self._role_name
+
     def __set_id(self, id: str):
         """Asigna un id; si es None, lo genera automáticamente.
 
@@ -212,6 +345,14 @@ class Person:
 
         self._fullName = fullName_stripped
 
+    def _set_fullName_unchecked(self, fullName: str):
+        """Asigna el nombre completo sin validarlo (solo para datos ya normalizados).
+
+        Args:
+            fullName (str): El nombre completo, ya validado y sin espacios extremos.
+        """
+        self._fullName = fullName
+
     def set_email(self, email: str):
         """Valida y asigna el correo electrónico.
 
@@ -226,16 +367,14 @@ class Person:
                 f"El email debe ser una cadena no vacía, recibido: {type(email).__name__}"
             )
         
-        # Patrón más estricto para validación de email
-        pattern = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
-
-        if not pattern.match(email):
+        if not _is_valid_email(email):
             raise ValidationException(
                 f"El email '{email}' no tiene un formato válido. "
                 f"Debe ser del tipo 'usuario@dominio.com'"
             )
 
-        self._email = email # Normalizar a minúsculas
+        # Internar: registros con el mismo email comparten un único objeto
+        self._email = sys.intern(email)
 
     def set_password(self, password: str):
         """Hashea la contraseña y la asigna.
@@ -261,23 +400,21 @@ class Person:
                 f"La contraseña no puede exceder los 100 caracteres, recibido: {len(password)}"
             )
         
-        self._password = generate_password_hash(password)
+        self._password = generate_password_hash(
+            password, method=self._HASH_METHOD, salt_length=self._HASH_SALT_LEN
+        )
 
     def __set_role(self, role: PersonRole):
         """Asigna el rol de la persona.
 
+        Solo se llama con roles ya resueltos en los puntos de entrada
+        (`__init__`, `update_from_dict`) mediante `_resolve_role`.
+
         Args:
             role (PersonRole): El rol a asignar.
-            
-        Raises:
-            ValidationException: Si role no es una instancia de PersonRole.
         """
-        if not isinstance(role, PersonRole):
-            raise ValidationException(
-                f"El rol debe ser una instancia de PersonRole, recibido: {type(role).__name__}"
-            )
-        
         self._role = role
+        self._role_name = role.name
             
     def add_historial(self, item: str):
         """Agrega un ítem al historial de la persona.
@@ -293,9 +430,6 @@ class Person:
                 f"El ítem del historial debe ser una cadena no vacía, recibido: {type(item).__name__}"
             )
         
-        if not hasattr(self, '_historial'):
-            self._historial = []
-        
         self._historial.append(item)
 
     def verify_password(self, password: str) -> bool:
@@ -366,8 +500,8 @@ class Person:
             "fullName": self._fullName,
             "email": self._email,
             "password": self._password,
-            "role": self._role.name,
-            "historial": getattr(self, '_historial', []),
+            "role": self._role_name,
+            "historial": self._historial,
         }
         
     def update_from_dict(self, data: dict):
@@ -406,14 +540,7 @@ class Person:
             self.change_password(data["password"], data["new_password"])
         
         if "role" in data:
-            try:
-                role_enum = PersonRole[data["role"]]
-                self.__set_role(role_enum)
-            except KeyError:
-                valid_roles = ", ".join([r.name for r in PersonRole])
-                raise ValidationException(
-                    f"Rol '{data['role']}' no válido. Roles válidos: {valid_roles}"
-                )
+            self.__set_role(_resolve_role(data["role"]))
         
         if "historial" in data:
             if not isinstance(data["historial"], list):
@@ -428,7 +555,7 @@ class Person:
         Returns:
             str: Cadena con información de la persona.
         """
-        return f"Person: {self._fullName} ({self._email}) - Role: {self._role.name}"
+        return f"Person: {self._fullName} ({self._email}) - Role: {self._role_name}"
 
     def __repr__(self):
         """Representación orientada a debugging.
@@ -436,14 +563,13 @@ class Person:
         Returns:
             str: Cadena para debugging.
         """
-        return f"Person(id={self._id}, fullName={self._fullName}, role={self._role.name})"
+        return f"Person(id={self._id}, fullName={self._fullName}, role={self._role_name})"
     
     def __eq__(self, other):
         """Compara la igualdad con otra instancia de Person.
 
         Regla:
-        - Si ambos objetos tienen `id`, se comparan los `id`.
-        - Si no, se compara el `email` (se asume único por usuario).
+        - Dos personas son iguales si tienen el mismo `id`.
         - Devuelve False si `other` no es una Person.
 
         Args:
@@ -456,9 +582,12 @@ class Person:
             return True
         if not isinstance(other, Person):
             return False
-        # Si ambos tienen id, usarlo como identidad
-    
-        # Fallback: comparar por email
         return self._id == other._id
-        
 
+    def __hash__(self):
+        """Hash basado en el `id`, coherente con `__eq__` (permite usar Person en set/dict).
+
+        Returns:
+            int: Hash del identificador.
+        """
+        return hash(self._id)
@@ -1,16 +1,43 @@
 from typing import TYPE_CHECKING
-from .person import Person
+from .person import Person, _demo_password_hash
 from ..enums import PersonRole
 from app.domain.exceptions import ValidationException
 
 if TYPE_CHECKING:
     from ..loan import Loan
+
+# Tipos de registro de historial permitidos (conjunto para pertenencia O(1)) y su mensaje
+_HISTORIAL_TYPES = frozenset(("loan", "return", "update", "cancel"))
+_HISTORIAL_TYPES_STR = "loan, return, update, cancel"
+
+# Índice de préstamos compartido por los usuarios sin préstamos (no se muta: `add_loan` lo reemplaza)
+_NO_LOANS: dict = {}
+
+
+def _loan_id(loan):
+    """Extrae el ID de un préstamo (string o objeto con `get_id()`); None si no es válido."""
+    if isinstance(loan, str):
+        return loan
+    get_id = getattr(loan, 'get_id', None)
+    return get_id() if get_id is not None else None
+
+
+def _historial_entry(entry):
+    """Normaliza un registro de historial a un valor serializable (dict o str)."""
+    if isinstance(entry, (dict, str)):
+        return entry
+    if hasattr(entry, 'to_dict'):
+        return entry.to_dict()
+    return str(entry)
     
 class User(Person):
-    __loans: list
+    # Se declaran con su nombre privado; Python los guarda como `_User__loans`/`_User__historial`
+    __slots__ = ("__loans", "__historial")
+
+    __loans: dict  # IDs de préstamos activos como claves (conjunto ordenado por inserción)
     __historial: list  # Historial completo de préstamos (activos + devueltos)
 
-    def __init__(self, fullName: str, email: str, password: str, loans: list, id: str = "00000000000000000", role: PersonRole = PersonRole.USER, password_is_hashed: bool = False, historial: list = None):
+    def __init__(self, fullName: str, email: str, password: str, loans: list, id: str = "00000000000000000", role: PersonRole = PersonRole.USER, password_is_hashed: bool = False, historial: list = None, trusted: bool = False):
         """Inicializa un usuario con sus datos y préstamos.
         
         Args:
@@ -22,6 +49,7 @@ class User(Person):
             role: Rol del usuario (por defecto USER).
             password_is_hashed: Indica si la contraseña ya está hasheada.
             historial: Historial de préstamos (por defecto lista vacía).
+            trusted: Indica si los datos vienen de la persistencia (ya validados).
             
         Raises:
             ValidationException: Si loans o historial no son listas válidas.
@@ -42,10 +70,10 @@ class User(Person):
             )
         
         # Llamar al constructor de Person (este ya valida fullName, email, password)
-        super().__init__(fullName, email, password, role, id, password_is_hashed=password_is_hashed)
+        super().__init__(fullName, email, password, role, id, password_is_hashed=password_is_hashed, trusted=trusted)
         
-        self.__set_loans(loans)
-        self.__set_historial(historial if historial is not None else [])
+        self.__set_loans(loans, trusted=trusted)
+        self.__set_historial(historial if historial is not None else [], trusted=trusted)
         
     @classmethod
     def from_dict(cls, data: dict, password_is_hashed: bool = True):
@@ -66,20 +94,18 @@ class User(Person):
                 f"El parámetro 'data' debe ser un diccionario, recibido: {type(data).__name__}"
             )
         
-        # Validar campos obligatorios
-        required_fields = ["fullName", "email", "password"]
-        missing_fields = [field for field in required_fields if field not in data]
-        
-        if missing_fields:
+        # Validar campos obligatorios (la lista de faltantes solo se construye si hay error)
+        if "fullName" not in data or "email" not in data or "password" not in data:
+            missing_fields = [field for field in ("fullName", "email", "password") if field not in data]
             raise ValidationException(
                 f"Faltan campos obligatorios en el diccionario: {', '.join(missing_fields)}"
             )
         
         # Crear instancia
         return cls(
-            fullName=data.get("fullName"),
-            email=data.get("email"),
-            password=data.get("password"),
+            fullName=data["fullName"],
+            email=data["email"],
+            password=data["password"],
             loans=data.get("loans", []),
             id=data.get("id"),
             role=PersonRole.USER,
@@ -87,6 +113,25 @@ class User(Person):
             historial=data.get("historial", [])
         )
 
+    @classmethod
+    def from_dicts_bulk(cls, records, role: PersonRole = PersonRole.USER) -> list:
+        """Crea muchos usuarios a partir de registros ya persistidos (carga masiva).
+        
+        Args:
+            records: Diccionarios como los de `from_dict`, más 'loans' e 'historial' opcionales.
+            role: Rol por defecto si el registro no trae uno.
+            
+        Returns:
+            list: Usuarios creados, en el mismo orden que `records`.
+        """
+        records = list(records)
+        users = super().from_dicts_bulk(records, role)
+        for user, data in zip(users, records):
+            loans = data.get("loans")
+            user.__loans = dict.fromkeys(loans) if loans else _NO_LOANS
+            # Copia propia: no compartir la lista JSON de la fila ORM (se muta en sitio al añadir registros)
+            user.__historial = list(data.get("historial") or [])
+        return users
         
     @classmethod
     def from_search_api(cls, id: str):
@@ -106,39 +151,39 @@ class User(Person):
                 f"El ID debe ser una cadena no vacía, recibido: {type(id).__name__}"
             )
         
-        return cls(
-            fullName="Peppermint Butler",
-            email="peppermintButler.aventure@time.cartoon",
-            password="adventuretime",
-            loans=[],
-            id=id,
-            historial=[]
+        return cls._from_trusted(
+            id, "Peppermint Butler", "peppermintButler.aventure@time.cartoon", _demo_password_hash()
         )
         
     @classmethod
     def default(cls):
         """Crea un usuario con valores por defecto para testing."""
-        return cls(
-            fullName="Finn",
-            email="finn.adventure@time.cartoon",
-            password="adventuretime",
-            loans=[],
-            historial=[]
+        return cls._from_trusted(
+            "00000000000000000", "Finn", "finn.adventure@time.cartoon", _demo_password_hash()
         )
+
+    @classmethod
+    def _from_trusted(cls, id: str, fullName: str, email: str, password_hash: str, role: PersonRole = PersonRole.USER):
+        """Igual que `Person._from_trusted`, sin préstamos ni historial."""
+        user = super()._from_trusted(id, fullName, email, password_hash, role)
+        user.__loans = _NO_LOANS
+        user.__historial = []
+        return user
         
     def get_loans(self):
         """Obtiene la lista de IDs de préstamos activos."""
-        return self.__loans
+        return list(self.__loans)
     
     def get_historial(self):
         """Obtiene el historial completo de préstamos del usuario."""
         return self.__historial
     
-    def __set_loans(self, loans: list):
+    def __set_loans(self, loans: list, trusted: bool = False):
         """Establece la lista de préstamos activos.
         
         Args:
             loans: Lista de IDs de préstamos.
+            trusted: Si los préstamos vienen de la persistencia (ya son IDs); omite la validación por elemento.
             
         Raises:
             ValidationException: Si loans no es una lista.
@@ -148,20 +193,34 @@ class User(Person):
                 f"loans debe ser una lista, recibido: {type(loans).__name__}"
             )
         
-        # Validar que todos los elementos sean strings o tengan get_id()
+        if not loans:
+            self.__loans = _NO_LOANS
+            return
+        
+        # Camino rápido: datos de la persistencia o lista solo de IDs (el caso habitual)
+        if trusted or all(type(loan) is str for loan in loans):
+            self.__loans = dict.fromkeys(loans)
+            return
+        
+        # Camino lento: entradas mixtas (IDs y objetos Loan), se validan y extraen en una sola pasada
+        loan_ids = []
         for i, loan in enumerate(loans):
-            if not isinstance(loan, str) and not hasattr(loan, 'get_id'):
+            loan_id = _loan_id(loan)
+            if loan_id is None:
                 raise ValidationException(
                     f"Elemento {i} en loans no es válido. Debe ser string o tener método get_id()"
                 )
+            loan_ids.append(loan_id)
         
-        self.__loans = loans
+        # Guardar solo IDs (normalizados al escribir) indexados para consultas y borrados O(1)
+        self.__loans = dict.fromkeys(loan_ids)
     
-    def __set_historial(self, historial: list):
+    def __set_historial(self, historial: list, trusted: bool = False):
         """Establece el historial de préstamos.
         
         Args:
             historial: Lista de registros históricos.
+            trusted: Si el historial viene de la persistencia (ya serializable); no se normaliza.
             
         Raises:
             ValidationException: Si historial no es una lista.
@@ -171,6 +230,14 @@ class User(Person):
                 f"historial debe ser una lista, recibido: {type(historial).__name__}"
             )
         
+        # Normalizar al asignar para que `to_dict` solo tenga que copiar la lista
+        if not trusted and not all(isinstance(entry, (dict, str)) for entry in historial):
+            historial = [_historial_entry(entry) for entry in historial]
+        else:
+            # Copia propia: la lista recibida puede ser la columna JSON de la fila ORM,
+            # y mutarla en el sitio no se detecta como cambio al persistir
+            historial = list(historial)
+
         self.__historial = historial
         
     def add_loan(self, loan):
@@ -186,11 +253,8 @@ class User(Person):
             raise ValidationException("No se puede agregar un préstamo None")
         
         # Extraer ID del préstamo
-        if isinstance(loan, str):
-            loan_id = loan
-        elif hasattr(loan, 'get_id'):
-            loan_id = loan.get_id()
-        else:
+        loan_id = _loan_id(loan)
+        if loan_id is None:
             raise ValidationException(
                 f"El préstamo debe ser un string (ID) o tener método get_id(), "
                 f"recibido: {type(loan).__name__}"
@@ -202,8 +266,10 @@ class User(Person):
                 f"El préstamo con ID '{loan_id}' ya existe en los préstamos activos del usuario"
             )
         
-        # Agregar a préstamos activos
-        self.__loans.append(loan_id)
+        # Agregar a préstamos activos (materializar el índice propio si era el compartido)
+        if self.__loans is _NO_LOANS:
+            self.__loans = {}
+        self.__loans[loan_id] = None
         
         # Agregar al historial
         self.__historial.append({"type": "loan", "id": loan_id})
@@ -233,10 +299,9 @@ class User(Person):
             )
         
         # Validar tipos permitidos
-        valid_types = ["loan", "return", "update", "cancel"]
-        if type not in valid_types:
+        if type not in _HISTORIAL_TYPES:
             raise ValidationException(
-                f"Tipo de registro inválido: '{type}'. Tipos válidos: {', '.join(valid_types)}"
+                f"Tipo de registro inválido: '{type}'. Tipos válidos: {_HISTORIAL_TYPES_STR}"
             )
         
         self.__historial.append({"type": type, "id": content})
@@ -254,19 +319,15 @@ class User(Person):
             raise ValidationException("No se puede eliminar un préstamo None")
         
         # Extraer ID del préstamo
-        if isinstance(loan, str):
-            loan_id = loan
-        elif hasattr(loan, 'get_id'):
-            loan_id = loan.get_id()
-        else:
+        loan_id = _loan_id(loan)
+        if loan_id is None:
             raise ValidationException(
                 f"El préstamo debe ser un string (ID) o tener método get_id(), "
                 f"recibido: {type(loan).__name__}"
             )
         
         # Intentar remover (no lanzar excepción si no existe, solo advertir)
-        if loan_id in self.__loans:
-            self.__loans.remove(loan_id)
+        self.__loans.pop(loan_id, None)
         # El préstamo permanece en el historial para auditoría
     
     def update_from_dict(self, data: dict):
@@ -316,45 +377,14 @@ class User(Person):
                 - loans contiene solo IDs de préstamos activos
                 - historial contiene objetos completos de préstamos (para auditoría)
         """
-        # Asegurarse de que loans solo contenga IDs (strings), no objetos Loan completos
-        loan_ids = []
-        for loan in self.__loans:
-            try:
-                if isinstance(loan, str):
-                    loan_ids.append(loan)
-                elif hasattr(loan, 'get_id'):
-                    loan_ids.append(loan.get_id())
-                else:
-                    # Fallback: convertir a string
-                    loan_ids.append(str(loan))
-            except Exception:
-                # Si hay error, omitir este préstamo
-                continue
-        
-        # El historial debe conservar los objetos completos (dicts)
-        historial_data = []
-        for hist in self.__historial:
-            try:
-                if isinstance(hist, dict):
-                    historial_data.append(hist)
-                elif isinstance(hist, str):
-                    historial_data.append(hist)
-                elif hasattr(hist, 'to_dict'):
-                    historial_data.append(hist.to_dict())
-                else:
-                    historial_data.append(str(hist))
-            except Exception:
-                # Si hay error, omitir este registro
-                continue
-        
         data = {
             "id": self._id,
             "fullName": self._fullName,
             "email": self._email,
             "password": self._password,
-            "loans": loan_ids,
-            "historial": historial_data,
-            "role": self._role.name,
+            "loans": list(self.__loans),  # ya son IDs (normalizados al escribir)
+            "historial": list(self.__historial),
+            "role": self._role_name,
         }
         return data
 
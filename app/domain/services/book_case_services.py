@@ -4,12 +4,15 @@ Este módulo proporciona la lógica de negocio para la gestión de estanterías
 y la aplicación de algoritmos de ordenamiento de libros según diferentes estrategias.
 """
 
+import logging
 from typing import Optional
 from app.domain.models import BookCase, Book
 from app.domain.models.enums import TypeOrdering
 from app.domain.algorithms.defientOrganicer import DeficientOrganizer
 from app.domain.algorithms.organizer_optimum import estanteria_optima
 
+logger = logging.getLogger(__name__)
+
 
 class BookCaseService:
     """Servicio para la gestión de estanterías y ordenamiento de libros.
@@ -77,10 +80,10 @@ class BookCaseService:
                 bookcase_result, dangerous_combinations = organizer.organize(books)
                 
                 if dangerous_combinations:
-                    print(f"⚠️ Se encontraron {len(dangerous_combinations)} combinaciones peligrosas.")
+                    logger.warning("Se encontraron %s combinaciones peligrosas.", len(dangerous_combinations))
                     organizer.print_dangerous_combinations()
                 
-                print(f"✓ Libros organizados usando algoritmo DEFICIENT.")
+                logger.debug("Libros organizados usando algoritmo DEFICIENT.")
                 
             elif ordering_type == TypeOrdering.OPTIMOUM:
                 # Convertir libros a formato para estanteria_optima
@@ -92,11 +95,11 @@ class BookCaseService:
                     })
                 
                 mejor_valor, mejor_solucion = estanteria_optima(libros_dict, weight_capacity)
-                print(f"Libros organizados usando algoritmo OPTIMOUM. Valor óptimo: {mejor_valor}")
+                logger.debug("Libros organizados usando algoritmo OPTIMOUM. Valor óptimo: %s", mejor_valor)
                 # mejor_solucion se guarda implícitamente en el algoritmo
                 
         except Exception as e:
-            print(f"Error aplicando algoritmo de ordenamiento: {e}")
+            logger.error("Error aplicando algoritmo de ordenamiento: %s", e)
     
     def has_bookcase_configured(self) -> bool:
         """Verifica si hay una estantería configurada.
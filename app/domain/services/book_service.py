@@ -1,8 +1,8 @@
 import logging
+from bisect import bisect_left, insort
 from app.persistence.repositories import BooksRepositorySQL
 from app.domain.models import Book
 from app.domain.exceptions import ValidationException, ResourceNotFoundException, RepositoryException
-from app.domain.algorithms import insertion_sort
 
 class BookService:
     """Servicio para gestionar libros con lógica de negocio."""
@@ -32,13 +32,22 @@ class BookService:
                     self._repository.orm_to_domain(orm_book) 
                     for orm_book in books_orm
                 ]
-                self._books = insertion_sort(self._books, key=lambda b: b.get_id_IBSN())
+                # Timsort en C (O(N log N)) sobre la lista recién construida, en sitio
+                self._books.sort(key=Book.get_id_IBSN)
                 self.logger.info(f"{len(self._books)} libros cargados y ordenados")
                 
         except Exception as e:
             self.logger.error(f"Error cargando libros: {e}", exc_info=True)
             raise RepositoryException(f"Error crítico al cargar libros: {e}")
     
+    def __cached_index(self, isbn: str) -> int:
+        """Índice de `isbn` en la caché `_books` (ordenada por ISBN) o -1 si no está."""
+        books = self._books
+        index = bisect_left(books, isbn, key=Book.get_id_IBSN)
+        if index < len(books) and books[index].get_id_IBSN() == isbn:
+            return index
+        return -1
+    
     def add(self, json: dict) -> Book:
         """Crea un nuevo libro."""
         try:
@@ -60,8 +69,8 @@ class BookService:
             
             # Convertir a dominio
             book_domain = self._repository.orm_to_domain(book_orm)
-            self._books.append(book_domain)
-            self._books = insertion_sort(self._books, key=lambda b: b.get_id_IBSN())
+            # La caché ya está ordenada: inserción en su posición, sin reordenar la lista entera
+            insort(self._books, book_domain, key=Book.get_id_IBSN)
             
             self.logger.info(f"Libro {book_domain.get_id_IBSN()} creado: {book_domain.get_title()}")
             return book_domain
@@ -155,9 +164,16 @@ class BookService:
             updated_orm = self._repository.update(isbn, **book_data)
             if updated_orm is None:
                 return None
-            self.__load()
+            book_domain = self._repository.orm_to_domain(updated_orm)
+            
+            # Actualizar la caché en su posición en vez de releer y reordenar toda la tabla
+            index = self.__cached_index(isbn)
+            if index >= 0 and book_domain.get_id_IBSN() == isbn:
+                self._books[index] = book_domain
+            else:
+                self.__load()
             self.logger.info(f"Libro {isbn} actualizado")
-            return self._repository.orm_to_domain(updated_orm)
+            return book_domain
         except Exception as e:
             self.logger.error(f"Error actualizando libro: {e}")
             raise RepositoryException(f"Error actualizando libro: {e}")
@@ -167,7 +183,9 @@ class BookService:
         try:
             result = self._repository.delete(isbn)
             if result:
-                self.__load()
+                index = self.__cached_index(isbn)
+                if index >= 0:
+                    del self._books[index]
                 return {"success": True}
             raise RepositoryException(f"Libro {isbn} no encontrado")
         except Exception as e:
@@ -51,7 +51,8 @@ class LoanService:
                                                          book_service=self.book_service)
             
             # ✅ AGREGAR: Actualizar usuario con el préstamo
-            user = self.user_service.get_by_id(loan.get_user_id())
+            # El usuario ya se resolvió al validar el préstamo: se reutiliza sin otra consulta
+            user = loan.get_user()
             if user:
                 user.add_loan(loan_domain)
                 self.user_service.update(user.get_id(), {
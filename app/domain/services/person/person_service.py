@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
 from app.domain.models import Person, User
 from app.domain.models.enums import PersonRole
-from app.domain.algorithms import insertion_sort
 from app.domain.exceptions import ValidationException, RepositoryException
 import logging
 
@@ -30,17 +30,23 @@ class PersonService(ABC):
                 self.logger.warning(f"No hay {self._role.name}s en la BD")
                 self._people = []
             else:
-                self._people = [
-                    self._repository.orm_to_domain(orm_person) 
-                    for orm_person in people_orm
-                ]
-                self._people = insertion_sort(self._people, key=lambda p: p.get_id())
+                self._people = self._repository.orm_to_domain_many(people_orm)
+                # Timsort en C (O(N log N)) sobre la lista recién construida, en sitio
+                self._people.sort(key=Person.get_id)
                 self.logger.info(f"{len(self._people)} {self._role.name}s cargados y ordenados")
                 
         except Exception as e:
             self.logger.error(f"Error cargando {self._role.name}s: {e}", exc_info=True)
             raise RepositoryException(f"Error crítico al cargar {self._role.name}s: {e}")
     
+    def __cached_index(self, person_id: str) -> int:
+        """Índice de `person_id` en la caché `_people` (ordenada por ID) o -1 si no está."""
+        people = self._people
+        index = bisect_left(people, person_id, key=Person.get_id)
+        if index < len(people) and people[index].get_id() == person_id:
+            return index
+        return -1
+    
     def add(self, json: dict) -> User:
         """Crea una nueva persona."""
         try:
@@ -53,14 +59,14 @@ class PersonService(ABC):
                 fullName=person.get_fullName(),
                 email=person.get_email(),
                 password=person.get_password(),
-                role=person.get_role().name,
+                role=person.get_role_name(),
                 is_active=True,
             )
             
             # Convertir a dominio
             person_domain = self._repository.orm_to_domain(person_orm)
-            self._people.append(person_domain)
-            self._people = insertion_sort(self._people, key=lambda p: p.get_id())
+            # La caché ya está ordenada: inserción en su posición, sin reordenar la lista entera
+            insort(self._people, person_domain, key=Person.get_id)
             
             self.logger.info(f"{self._role.name} {person_domain.get_id()} creado: {person_domain.get_email()}")
             return person_domain
@@ -77,7 +83,7 @@ class PersonService(ABC):
             people_orm = self._repository.read_all()
             if people_orm is None:
                 return []
-            return [self._repository.orm_to_domain(orm_p) for orm_p in people_orm]
+            return self._repository.orm_to_domain_many(people_orm)
         except Exception as e:
             self.logger.error(f"Error obteniendo {self._role.name}s: {e}")
             raise RepositoryException(f"Error obteniendo {self._role.name}s: {e}")
@@ -110,9 +116,16 @@ class PersonService(ABC):
             updated_orm = self._repository.update(person_id, **person_data)
             if updated_orm is None:
                 return None
-            self.__load()
+            person_domain = self._repository.orm_to_domain(updated_orm)
+            
+            # Actualizar la caché en su posición en vez de releer y reordenar toda la tabla
+            index = self.__cached_index(person_id)
+            if index >= 0 and person_domain.get_id() == person_id:
+                self._people[index] = person_domain
+            else:
+                self.__load()
             self.logger.info(f"{self._role.name} {person_id} actualizado")
-            return self._repository.orm_to_domain(updated_orm)
+            return person_domain
         except Exception as e:
             self.logger.error(f"Error actualizando {self._role.name}: {e}")
             raise RepositoryException(f"Error actualizando {self._role.name}: {e}")
@@ -1,9 +1,9 @@
 import logging
+from bisect import insort
 from app.persistence.repositories import UsersRepositorySQL
 from app.domain.models import User, Loan, Person
 from app.domain.models.enums import PersonRole
 from app.domain.exceptions import ValidationException, ResourceNotFoundException, RepositoryException
-from app.domain.algorithms import insertion_sort
 from .person_service import PersonService
 
 class UserService(PersonService):
@@ -13,7 +13,6 @@ class UserService(PersonService):
         
     def add(self, json: dict) -> User:
         """Crea usuario incluyendo loans/historial."""
-        print("UserService.add called with json:", json)
         person = Person.from_dict(json, role=self._role, password_is_hashed=False)
         loans = json.get("loans") or []
         historial = json.get("historial") or []
@@ -23,14 +22,13 @@ class UserService(PersonService):
                 fullName=person.get_fullName(),
                 email=person.get_email(),
                 password=person.get_password(),
-                role=person.get_role().name,
+                role=person.get_role_name(),
                 loans=loans,
                 historial=historial,
                 is_active=True,
             )
             user_domain = self._repository.orm_to_domain(user_orm)
-            self._people.append(user_domain)
-            self._people = insertion_sort(self._people, key=lambda p: p.get_id())
+            insort(self._people, user_domain, key=Person.get_id)
             return user_domain
         except Exception as e:
             raise RepositoryException(f"Error creando usuario: {e}")
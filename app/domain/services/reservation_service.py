@@ -5,10 +5,14 @@ utilizando un HashMap (diccionario) organizado por ISBN para acceso
 O(1) a las reservas de un libro específico.
 """
 
+import logging
+from datetime import datetime
 from typing import Optional, List, Tuple
 from app.domain.models import User, Book
 from app.domain.structures import Queue
 
+logger = logging.getLogger(__name__)
+
 
 class ReservationQueueService:
     """Servicio para gestionar la cola de reservas de libros.
@@ -51,13 +55,12 @@ class ReservationQueueService:
             self.__reservations_map[isbn].push(user)
             
             # Registrar en historial de todas las reservas
-            from datetime import datetime
             self.__all_reservations.append((isbn, user, datetime.now().isoformat()))
             
-            print(f"✅ Reserva agregada: {user.get_email()} para libro ISBN {isbn}")
+            logger.debug("Reserva agregada: %s para libro ISBN %s", user.get_email(), isbn)
             return True
         except Exception as e:
-            print(f"❌ Error agregando reserva: {e}")
+            logger.error("Error agregando reserva: %s", e)
             return False
     
     def get_next_reservation(self, book: Book) -> Optional[User]:
@@ -77,7 +80,7 @@ class ReservationQueueService:
             queue = self.__reservations_map[isbn]
             return queue.peek()
         except Exception as e:
-            print(f"❌ Error obteniendo próxima reserva: {e}")
+            logger.error("Error obteniendo próxima reserva: %s", e)
             return None
     
     def pop_reservation(self, book: Book) -> Optional[User]:
@@ -102,10 +105,10 @@ class ReservationQueueService:
                 del self.__reservations_map[isbn]
             
             if user:
-                print(f"📚 Reserva procesada: {user.get_email()} para libro ISBN {isbn}")
+                logger.debug("Reserva procesada: %s para libro ISBN %s", user.get_email(), isbn)
             return user
         except Exception as e:
-            print(f"❌ Error procesando reserva: {e}")
+            logger.error("Error procesando reserva: %s", e)
             return None
     
     def has_reservations_for_book(self, book: Book) -> bool:
@@ -125,7 +128,7 @@ class ReservationQueueService:
             queue = self.__reservations_map[isbn]
             return not queue.is_empty()
         except Exception as e:
-            print(f"❌ Error verificando reservas: {e}")
+            logger.error("Error verificando reservas: %s", e)
             return False
     
     def get_reservations_count_for_book(self, book: Book) -> int:
@@ -145,7 +148,7 @@ class ReservationQueueService:
             queue = self.__reservations_map[isbn]
             return len(queue)
         except Exception as e:
-            print(f"❌ Error contando reservas: {e}")
+            logger.error("Error contando reservas: %s", e)
             return 0
     
     def get_all_reservations_for_book(self, book: Book) -> List[User]:
@@ -165,7 +168,7 @@ class ReservationQueueService:
             queue = self.__reservations_map[isbn]
             return queue.to_list()
         except Exception as e:
-            print(f"❌ Error obteniendo reservas del libro: {e}")
+            logger.error("Error obteniendo reservas del libro: %s", e)
             return []
     
     def remove_user_from_all_reservations(self, user: User) -> bool:
@@ -184,10 +187,9 @@ class ReservationQueueService:
             # Revisar todas las colas
             isbns_to_remove = []
             for isbn, queue in self.__reservations_map.items():
-                users_list = queue.to_list()
-                # Crear nueva cola sin el usuario
+                # Crear nueva cola sin el usuario (se recorre la cola directamente, sin copiarla)
                 new_queue = Queue[User]()
-                for u in users_list:
+                for u in queue:
                     if u.get_id() != user_id:
                         new_queue.push(u)
                     else:
@@ -204,10 +206,10 @@ class ReservationQueueService:
                 del self.__reservations_map[isbn]
             
             if found:
-                print(f"✅ Usuario {user.get_email()} eliminado de todas las reservas")
+                logger.debug("Usuario %s eliminado de todas las reservas", user.get_email())
             return found
         except Exception as e:
-            print(f"❌ Error eliminando usuario de reservas: {e}")
+            logger.error("Error eliminando usuario de reservas: %s", e)
             return False
     
     def get_user_position_in_queue(self, user: User, book: Book) -> Optional[int]:
@@ -225,16 +227,15 @@ class ReservationQueueService:
             if isbn not in self.__reservations_map:
                 return None
             
-            queue = self.__reservations_map[isbn]
-            users_list = queue.to_list()
-            
-            for idx, u in enumerate(users_list):
-                if u.get_id() == user.get_id():
+            user_id = user.get_id()
+            # Recorrido directo de la cola: evita copiarla con to_list() solo para buscar
+            for idx, u in enumerate(self.__reservations_map[isbn]):
+                if u.get_id() == user_id:
                     return idx
             
             return None
         except Exception as e:
-            print(f"❌ Error obteniendo posición en cola: {e}")
+            logger.error("Error obteniendo posición en cola: %s", e)
             return None
     
     def clear_reservations_for_book(self, book: Book) -> bool:
@@ -252,10 +253,10 @@ class ReservationQueueService:
                 return False
             
             del self.__reservations_map[isbn]
-            print(f"✅ Reservas del libro ISBN {isbn} eliminadas")
+            logger.debug("Reservas del libro ISBN %s eliminadas", isbn)
             return True
         except Exception as e:
-            print(f"❌ Error limpiando reservas: {e}")
+            logger.error("Error limpiando reservas: %s", e)
             return False
     
     def get_total_reservations(self) -> int:
@@ -270,7 +271,7 @@ class ReservationQueueService:
                 total += len(queue)
             return total
         except Exception as e:
-            print(f"❌ Error contando total de reservas: {e}")
+            logger.error("Error contando total de reservas: %s", e)
             return 0
     
     def get_all_pending_reservations(self) -> dict[str, List[User]]:
@@ -285,7 +286,7 @@ class ReservationQueueService:
                 result[isbn] = queue.to_list()
             return result
         except Exception as e:
-            print(f"❌ Error obteniendo todas las reservas: {e}")
+            logger.error("Error obteniendo todas las reservas: %s", e)
             return {}
     
     def is_empty(self) -> bool:
@@ -30,6 +30,23 @@ class AdminsRepositorySQL(BaseRepository[AdminORM]):
             password=orm_admin.password,
             id=orm_admin.id,
             password_is_hashed=True,
+            trusted=True,
+        )
+
+
+    def orm_to_domain_many(self, orm_admins: list[AdminORM]) -> list[Admin]:
+        """Convierte varios AdminORM a Admin del dominio en una sola pasada."""
+        return Admin.from_dicts_bulk(
+            (
+                {
+                    "id": orm_admin.id,
+                    "fullName": orm_admin.fullName,
+                    "email": orm_admin.email,
+                    "password": orm_admin.password,
+                }
+                for orm_admin in orm_admins
+            ),
+            role=PersonRole.ADMIN,
         )
     
     
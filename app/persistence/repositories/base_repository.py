@@ -16,7 +16,10 @@ class BaseRepository(Generic[T]):
         return obj
     
     def read(self, id: str) -> Optional[T]:
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        # Búsqueda por clave primaria; Session.get no admite None (el filtro anterior devolvía None)
+        if id is None:
+            return None
+        return self.db.get(self.model, id)
     
     def read_all(self) -> List[T]:
         return self.db.query(self.model).all()
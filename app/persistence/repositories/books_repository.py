@@ -19,8 +19,10 @@ class BooksRepositorySQL(BaseRepository[BookORM]):
         return self.read_by_isbn(isbn)
     
     def read_by_isbn(self, isbn: str) -> Optional[BookORM]:
-        """Obtiene un libro por ISBN."""
-        return self.db.query(BookORM).filter(BookORM.id_IBSN == isbn).first()
+        """Obtiene un libro por ISBN (clave primaria)."""
+        if isbn is None:
+            return None
+        return self.db.get(BookORM, isbn)
     
     def read_by_title(self, title: str) -> List[BookORM]:
         """Obtiene libros que coincidan con el título (búsqueda parcial)."""
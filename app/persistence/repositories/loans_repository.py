@@ -18,7 +18,10 @@ class LoansRepositorySQL(BaseRepository[LoanORM]):
     
     def read(self, loan_id: str) -> Optional[LoanORM]:
         """Obtiene un préstamo por ID (sobrescribe BaseRepository)."""
-        return self.db.query(LoanORM).filter(LoanORM.id == loan_id).first()
+        # Búsqueda por clave primaria; Session.get no admite None
+        if loan_id is None:
+            return None
+        return self.db.get(LoanORM, loan_id)
     
     def read_with_relations(self, loan_id: str) -> Optional[LoanORM]:
         """Obtiene un préstamo por ID con usuario y libro cargados."""
@@ -148,7 +151,8 @@ class LoansRepositorySQL(BaseRepository[LoanORM]):
         }
         
     def __str__(self):
-        return f"LoansRepositorySQL(total_loans={len(self.read_all())})"
+        # COUNT en la BD en lugar de materializar todos los préstamos solo para contarlos
+        return f"LoansRepositorySQL(total_loans={self.db.query(LoanORM).count()})"
     
     def __repr__(self):
-        return f"LoansRepositorySQL(total_loans={len(self.read_all())})"
+        return f"LoansRepositorySQL(total_loans={self.db.query(LoanORM).count()})"
@@ -45,20 +45,31 @@ class UsersRepositorySQL(BaseRepository[UserORM]):
         if not orm_user:
             return None
         
-        from app.domain.models.enums import PersonRole
-        
-        # Convertir string de BD a enum PersonRole
-        role_enum = PersonRole[orm_user.role] if isinstance(orm_user.role, str) else orm_user.role
-        
         return User(
             fullName=orm_user.fullName,
             email=orm_user.email,
             password=orm_user.password,
             loans=orm_user.loans or [],
             id=orm_user.id,
-            role=role_enum,
+            role=orm_user.role,  # Person resuelve el nombre del rol al enum
             password_is_hashed=True,
-            historial=orm_user.historial or []
+            historial=orm_user.historial or [],
+            trusted=True
+        )
+        
+    def orm_to_domain_many(self, orm_users: list[UserORM]) -> list[User]:
+        """Convierte varios UserORM a User del dominio en una sola pasada."""
+        return User.from_dicts_bulk(
+            {
+                "id": orm_user.id,
+                "fullName": orm_user.fullName,
+                "email": orm_user.email,
+                "password": orm_user.password,
+                "role": orm_user.role,
+                "loans": orm_user.loans,
+                "historial": orm_user.historial,
+            }
+            for orm_user in orm_users
         )
         
     def domain_to_orm(self, user: User) -> UserORM:
@@ -73,7 +84,7 @@ class UsersRepositorySQL(BaseRepository[UserORM]):
             password=user.get_password(),
             loans=user.get_loans(),
             historial=user.get_historial(),
-            role=user.get_role().name,
+            role=user.get_role_name(),
             is_active=True
         )
         
@@ -10,8 +10,11 @@ from enum import Enum
 from pathlib import Path
 import json
 import csv
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 class FileType(Enum):
     """Tipos de archivo soportados por FileManager."""
     JSON = "json"
@@ -267,10 +270,10 @@ class FileManager:
         try:
             p.parent.mkdir(parents=True, exist_ok=True)
         except PermissionError as e:
-            print(f"FileManager: permiso denegado al crear directorio {p.parent}: {e}")
+            logger.error("FileManager: permiso denegado al crear directorio %s: %s", p.parent, e)
             raise
         except Exception as e:
-            print(f"FileManager: error creando directorio {p.parent}: {e}")
+            logger.error("FileManager: error creando directorio %s: %s", p.parent, e)
             raise
         
         # Escribir el contenido según el tipo (se lanzarán excepciones si algo falla).
@@ -281,7 +284,7 @@ class FileManager:
                 self.__write_csv(p, content)
         except Exception as e:
             # Mantener mensaje de error y volver a lanzar
-            print(f"FileManager: error al escribir en {p}: {e}")
+            logger.error("FileManager: error al escribir en %s: %s", p, e)
             raise
                 
     def __apppend_json(self, existing: dict | list, content: dict | list[dict]) -> None:
@@ -30,15 +30,15 @@ import threading
 _id_counter_lock = threading.Lock()
 _id_counter = 0
 
-def __next_id_suffix() -> int:
-    """Devuelve un sufijo numérico de 4 dígitos; protegido por lock para evitar duplicados."""
+def generate_id():
+    """Genera un ID ordenable por tiempo: '{epoch_ms:013d}{suffix:04d}'.
+
+    El sufijo se reserva dentro del lock sin llamar a una función auxiliar y el
+    timestamp se obtiene en enteros (`time_ns`), sin pasar por float.
+    """
     global _id_counter
     with _id_counter_lock:
         _id_counter += 1
-        return _id_counter % 10000  # 4 dígitos, rueda cada 10000
-    
-def generate_id():
-    """Genera un ID ordenable por tiempo: '{epoch_ms:013d}{suffix:04d}'."""
-    ts_ms = int(time.time() * 1000)  # timestamp en milisegundos
-    suffix = __next_id_suffix()
-    return f"{ts_ms:013d}{suffix:04d}"  # 13 dígitos para timestamp + 4 dígitos para el sufijo
\ No newline at end of file
+        suffix = _id_counter % 10000  # 4 dígitos, rueda cada 10000
+    ts_ms = time.time_ns() // 1_000_000  # timestamp en milisegundos
+    return f"{ts_ms:013d}{suffix:04d}"  # 13 dígitos para timestamp + 4 dígitos para el sufijo
@@ -10,12 +10,12 @@ from contextlib import asynccontextmanager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("🚀 Iniciando aplicación...")
+    logger.info("Iniciando aplicación...")
     init_db()  # ← AQUÍ: Crear tablas al iniciar
-    print("✅ Base de datos inicializada")
+    logger.info("Base de datos inicializada")
     yield
     # Shutdown
-    print("🛑 Deteniendo aplicación...")
+    logger.info("Deteniendo aplicación...")
     
 logger = setup_logging(log_level="DEBUG")  # ← Cambiar a "INFO" en producción
 